@@ -5,7 +5,10 @@ from typing import List, Dict, Tuple
 import random
 from utils.seating_algorithm import generate_seating_arrangement
 from utils.excel_export import create_excel_data, create_excel_file
+from utils.seat_layout import get_seat_grid
+from utils.chart_export import create_chart_layout, create_svg_file, create_pdf_file
 from utils.data_manager import create_data_package, save_data_to_json, load_data_from_json, validate_data_package
+from utils.roster_import import compute_file_hash, parse_roster, find_duplicate_names, find_seat_conflicts, build_class_packages, class_sort_key
 
 # 페이지 설정
 st.set_page_config(
@@ -35,56 +38,45 @@ if 'cols' not in st.session_state:
 if 'is_teacher_view' not in st.session_state:
     st.session_state.is_teacher_view = False
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def load_roster(file_hash: str, filename: str, _file_bytes: bytes) -> Dict[str, List[Dict]]:
+    """명단 파일 파싱 결과를 파일 해시 기준으로 캐시 (파일 내용 자체는 해싱하지 않음)"""
+    return parse_roster(_file_bytes, filename)
+
 def render_seating_grid(layout_type: str, rows: int, cols: int, seating_arrangement: Dict[int, str], is_teacher_view: bool = False):
     """자리 배치 그리드 렌더링"""
+    grid, column_labels, row_labels = get_seat_grid(layout_type, rows, cols, is_teacher_view)
+    
     if layout_type == 'pairs':
         # 짝꿍형 배치
-        sections = rows
-        rows_per_section = cols
-        
-        for s in range(sections):
-            section_label = f'{sections - s}분단' if is_teacher_view else f'{s + 1}분단'
+        for start_col, _, section_label in column_labels:
             st.subheader(f"{section_label}")
             
             cols_container = st.columns(2)
             
-            for r in range(rows_per_section):
-                read_row = rows_per_section - 1 - r if is_teacher_view else r
-                
-                left_index = (s * rows_per_section * 2) + (read_row * 2)
-                right_index = left_index + 1
-                
-                if is_teacher_view:
-                    left_index, right_index = right_index, left_index
-                
-                left_student = seating_arrangement.get(left_index, '')
-                right_student = seating_arrangement.get(right_index, '')
+            for row_label, row_indices in zip(row_labels, grid):
+                left_student = seating_arrangement.get(row_indices[start_col], '')
+                right_student = seating_arrangement.get(row_indices[start_col + 1], '')
                 
                 with cols_container[0]:
-                    st.write(f"**{r + 1}행 왼쪽**")
+                    st.write(f"**{row_label} 왼쪽**")
                     st.info(left_student if left_student else "빈 자리")
                 
                 with cols_container[1]:
-                    st.write(f"**{r + 1}행 오른쪽**")
+                    st.write(f"**{row_label} 오른쪽**")
                     st.info(right_student if right_student else "빈 자리")
     else:
         # 기본형 배치
-        for r in range(rows):
-            row_label = f'{rows - r}행' if is_teacher_view else f'{r + 1}행'
+        for row_label, row_indices in zip(row_labels, grid):
             st.subheader(f"{row_label}")
             
             cols_container = st.columns(cols)
             
-            for c in range(cols):
-                read_row = rows - 1 - r if is_teacher_view else r
-                read_col = cols - 1 - c if is_teacher_view else c
-                
-                index = read_row * cols + read_col
+            for c, index in enumerate(row_indices):
                 student = seating_arrangement.get(index, '')
                 
                 with cols_container[c]:
-                    col_label = f'{cols - c}열' if is_teacher_view else f'{c + 1}열'
-                    st.write(f"**{col_label}**")
+                    st.write(f"**{column_labels[c][2]}**")
                     st.info(student if student else "빈 자리")
 
 def main():
@@ -114,6 +106,108 @@ def main():
         
         st.write(f"총 {len(st.session_state.students)}명")
         
+        # 명단 파일 가져오기
+        roster_file = st.file_uploader("📋 명단 파일 가져오기", type=['csv', 'xlsx'], key="roster_file")
+        if roster_file:
+            try:
+                file_bytes = roster_file.getvalue()
+                file_hash = compute_file_hash(file_bytes)
+                roster = load_roster(file_hash, roster_file.name, file_bytes)
+                
+                if roster:
+                    class_names = sorted(roster.keys(), key=class_sort_key)
+                    selected_class = st.selectbox(
+                        "반 선택",
+                        class_names,
+                        format_func=lambda x: x if x else "(반 정보 없음)",
+                        key="roster_class"
+                    )
+                    
+                    duplicates = find_duplicate_names(roster[selected_class])
+                    if duplicates:
+                        st.warning(f"중복된 이름: {', '.join(duplicates)} (번호를 붙여 구분합니다)")
+                    
+                    seat_conflicts = find_seat_conflicts(
+                        roster[selected_class],
+                        st.session_state.layout_type,
+                        st.session_state.rows,
+                        st.session_state.cols
+                    )
+                    if seat_conflicts:
+                        st.warning("적용되지 않는 지정 자리: " + " / ".join(seat_conflicts))
+                    
+                    if st.button("명단 적용"):
+                        packages = build_class_packages(
+                            {selected_class: roster[selected_class]},
+                            st.session_state.layout_type,
+                            st.session_state.rows,
+                            st.session_state.cols
+                        )
+                        data = packages[selected_class]
+                        st.session_state.students = data['students']
+                        st.session_state.pre_assigned_seats = data['pre_assigned_seats']
+                        st.session_state.disabled_seats = data['disabled_seats']
+                        st.session_state.distanced_students = data['distanced_students']
+                        st.session_state.seating_arrangement = {}
+                        st.rerun()
+                    
+                    # 전체 반 자리 배치 후 반별 한 페이지씩 PDF로 묶기
+                    if st.button("🖨️ 전체 반 자리배치 PDF"):
+                        packages = build_class_packages(
+                            roster,
+                            st.session_state.layout_type,
+                            st.session_state.rows,
+                            st.session_state.cols
+                        )
+                        
+                        # 자리 수보다 학생이 많은 반은 남는 학생이 배치도에서 빠짐
+                        if st.session_state.layout_type == 'pairs':
+                            total_seats = st.session_state.rows * st.session_state.cols * 2
+                        else:
+                            total_seats = st.session_state.rows * st.session_state.cols
+                        overfull_classes = [
+                            f"{class_name or '(반 정보 없음)'} ({len(packages[class_name]['students'])}명)"
+                            for class_name in class_names
+                            if len(packages[class_name]['students']) > total_seats - len(packages[class_name]['disabled_seats'])
+                        ]
+                        if overfull_classes:
+                            st.warning(
+                                f"자리 수({total_seats}석)보다 학생이 많아 일부 학생이 빠지는 반: "
+                                f"{', '.join(overfull_classes)}. 책상 배열을 늘린 뒤 다시 만들어 주세요."
+                            )
+                        
+                        chart_layouts = []
+                        for class_name in class_names:
+                            data = packages[class_name]
+                            arrangement = generate_seating_arrangement(
+                                data['students'],
+                                data['layout_type'],
+                                data['rows'],
+                                data['cols'],
+                                data['pre_assigned_seats'],
+                                data['disabled_seats'],
+                                data['distanced_students']
+                            )
+                            chart_layouts.append(create_chart_layout(
+                                arrangement,
+                                data['layout_type'],
+                                data['rows'],
+                                data['cols'],
+                                st.session_state.is_teacher_view,
+                                class_name
+                            ))
+                        
+                        st.download_button(
+                            label="📥 PDF 다운로드",
+                            data=create_pdf_file(chart_layouts),
+                            file_name="전체반_자리배치.pdf",
+                            mime="application/pdf"
+                        )
+                else:
+                    st.error("명단 파일에 학생 이름이 없습니다.")
+            except ValueError as e:
+                st.error(f"명단 파일 오류: {e}")
+        
         # 그룹명 입력
         group_name = st.text_input("그룹명", placeholder="예: 3-4 (27명)")
         
@@ -306,6 +400,30 @@ def main():
                     file_name=filename,
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                 )
+                
+                # 인쇄용 배치도
+                chart_layout = create_chart_layout(
+                    st.session_state.seating_arrangement,
+                    st.session_state.layout_type,
+                    st.session_state.rows,
+                    st.session_state.cols,
+                    st.session_state.is_teacher_view,
+                    group_name
+                )
+                view_label = "교사기준" if st.session_state.is_teacher_view else "학생기준"
+                
+                st.download_button(
+                    label="🖨️ PDF 다운로드",
+                    data=create_pdf_file([chart_layout]),
+                    file_name=f"자리배치결과({view_label}).pdf",
+                    mime="application/pdf"
+                )
+                st.download_button(
+                    label="🖼️ SVG 다운로드",
+                    data=create_svg_file(chart_layout),
+                    file_name=f"자리배치결과({view_label}).svg",
+                    mime="image/svg+xml"
+                )
         
         # 자리 배치 결과 표시
         if st.session_state.seating_arrangement:
@@ -326,16 +444,17 @@ def main():
         with st.expander("📖 사용법 안내"):
             st.markdown("""
             ### 기본 사용법
-            1. **명단 입력**: 학생 이름을 한 줄에 한 명씩 입력
+            1. **명단 입력**: 학생 이름을 한 줄에 한 명씩 입력하거나 CSV/엑셀 명단 파일 가져오기
             2. **배치 설정**: 원하는 책상 배열 유형과 크기 설정
             3. **자리 배치**: '자리 바꾸기!' 버튼으로 랜덤 배치 생성
             4. **결과 확인**: 교사/학생 기준으로 보기 전환 가능
-            5. **엑셀 저장**: 결과를 엑셀 파일로 다운로드
+            5. **엑셀 저장**: 결과를 엑셀 파일로 다운로드 (인쇄용 PDF/SVG도 지원)
             
             ### 고급 기능
             - **사전 자리 지정**: 특정 학생을 원하는 자리에 고정
             - **자리 띄우기**: 선택한 학생들이 서로 붙어 앉지 않도록 설정
             - **데이터 저장**: 설정을 JSON 파일로 저장하여 나중에 불러오기 가능
+            - **명단 파일**: '반', '번호', '이름', '띄우기', '지정자리' 열이 있는 CSV/XLSX 파일을 반별로 가져오기
             """)
 
 if __name__ == "__main__":
@@ -0,0 +1,122 @@
+"""
+인쇄용 자리 배치도(SVG/PDF) 내보내기 테스트
+"""
+import re
+import xml.etree.ElementTree as ET
+import zlib
+
+import pytest
+
+from utils.chart_export import (
+    MIN_NAME_SIZE,
+    PAGE_HEIGHT,
+    PAGE_WIDTH,
+    _name_lines,
+    _text_width,
+    create_chart_layout,
+    create_pdf_file,
+    create_svg_file,
+)
+
+# 화면에서 설정 가능한 가장 큰 배치 (기본형 15x15, 짝꿍형 10분단 x 10행)
+LARGEST_LAYOUTS = [('default', 15, 15), ('pairs', 10, 10)]
+
+
+def full_arrangement(layout_type: str, rows: int, cols: int, name: str = "김민수(12)") -> dict:
+    """모든 자리에 학생이 앉은 배치"""
+    total_seats = rows * cols * 2 if layout_type == 'pairs' else rows * cols
+    return {i: f"{name}{i}" for i in range(total_seats)}
+
+
+def pdf_streams(pdf: bytes) -> list:
+    """PDF 콘텐츠 스트림 압축 해제"""
+    return [
+        zlib.decompress(match.group(1)).decode("ascii")
+        for match in re.finditer(rb"stream\n(.*?)\nendstream", pdf, re.S)
+    ]
+
+
+def test_pdf_xref_offsets_point_at_objects():
+    layouts = [
+        create_chart_layout(full_arrangement(layout_type, rows, cols), layout_type, rows, cols, view, "3-1")
+        for layout_type, rows, cols in LARGEST_LAYOUTS
+        for view in (False, True)
+    ]
+    pdf = create_pdf_file(layouts)
+
+    xref_offset = int(pdf.rsplit(b"startxref\n", 1)[1].split()[0])
+    assert pdf[xref_offset:].startswith(b"xref\n")
+
+    lines = pdf[xref_offset:].split(b"\n")
+    count = int(lines[1].split()[1])
+    entries = lines[3:2 + count]
+    assert len(entries) == count - 1
+    for number, entry in enumerate(entries, start=1):
+        offset = int(entry[:10])
+        assert pdf[offset:].startswith(f"{number} 0 obj\n".encode("ascii"))
+
+    assert f"/Size {count} ".encode("ascii") in pdf
+    assert pdf.endswith(b"%%EOF\n")
+
+
+def test_pdf_batch_page_count():
+    layouts = [create_chart_layout({0: "김자두"}, 'default', 5, 6, False, f"{i}반") for i in range(7)]
+    pdf = create_pdf_file(layouts)
+
+    assert b"/Count 7 " in pdf
+    assert pdf.count(b"/Type /Page ") == 7
+    assert len(pdf_streams(pdf)) == 7
+
+
+def test_pdf_requires_pages():
+    with pytest.raises(ValueError):
+        create_pdf_file([])
+
+
+def test_svg_is_valid_xml_with_escaped_text():
+    title = '3-1 <A&B> "반"'
+    layout = create_chart_layout({0: "<김&이>"}, 'default', 2, 2, False, title)
+    root = ET.fromstring(create_svg_file(layout))
+
+    texts = [element.text for element in root.iter("{http://www.w3.org/2000/svg}text")]
+    assert title in texts
+    assert "<김&이>" in texts
+
+
+@pytest.mark.parametrize("layout_type, rows, cols", LARGEST_LAYOUTS)
+@pytest.mark.parametrize("is_teacher_view", [False, True])
+def test_boxes_and_labels_inside_page(layout_type, rows, cols, is_teacher_view):
+    layout = create_chart_layout(
+        full_arrangement(layout_type, rows, cols), layout_type, rows, cols, is_teacher_view, "3-1"
+    )
+
+    for x, y, w, h, _, _ in layout["boxes"]:
+        assert 0 <= x and x + w <= PAGE_WIDTH
+        assert 0 <= y and y + h <= PAGE_HEIGHT
+    for x, y, text, size in layout["labels"]:
+        half_width = _text_width(text, size) / 2
+        assert 0 <= x - half_width and x + half_width <= PAGE_WIDTH
+        assert 0 <= y <= PAGE_HEIGHT
+
+
+def test_long_names_wrapped_inside_box():
+    layout = create_chart_layout(full_arrangement('pairs', 10, 10), 'pairs', 10, 10)
+    _, _, w, h, text, size = layout["boxes"][1]
+
+    lines = _name_lines(0, 0, w, h, text, size)
+    assert [line[2] for line in lines] == ["김민수", "(12)0"]
+    for _, y, line, line_size in lines:
+        assert line_size >= MIN_NAME_SIZE
+        assert 0 <= y - line_size / 2 and y + line_size / 2 <= h
+
+
+def test_names_clipped_to_seat_box():
+    layout = create_chart_layout({0: "아주아주아주긴이름의학생"}, 'pairs', 10, 10)
+
+    svg = create_svg_file(layout).decode("utf-8")
+    assert svg.count("<clipPath") == 2
+    assert 'clip-path="url(#seat1)"' in svg
+
+    content = pdf_streams(create_pdf_file([layout]))[0]
+    assert content.count(" re W n") == 2
+    assert content.count("q ") == content.count("\nQ") == 2
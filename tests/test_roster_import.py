@@ -0,0 +1,161 @@
+"""
+명단 파일 가져오기 테스트
+"""
+import io
+
+import pytest
+
+from utils.roster_import import (
+    build_class_packages,
+    class_sort_key,
+    compute_file_hash,
+    find_duplicate_names,
+    find_seat_conflicts,
+    parse_roster,
+)
+
+
+def csv_bytes(text: str, encoding: str = "utf-8") -> bytes:
+    """CSV 문자열을 업로드 파일과 같은 바이트 데이터로 변환"""
+    return text.encode(encoding)
+
+
+def class_students(csv_text: str, class_name: str = "") -> list:
+    """CSV 하나를 읽어 특정 반의 최종 학생 명단 반환"""
+    roster = parse_roster(csv_bytes(csv_text), "roster.csv")
+    return build_class_packages(roster, 'default', 5, 6)[class_name]["students"]
+
+
+def test_header_aliases_and_flags():
+    roster = parse_roster(
+        csv_bytes("반,번호,이름,띄우기,지정자리\n3-1,1,김자두,O,\n3-1,2,백레몬,,3\n3-2,1,홍석류,,\n"),
+        "roster.csv"
+    )
+
+    assert list(roster) == ["3-1", "3-2"]
+    assert roster["3-1"][0] == {"name": "김자두", "number": "1", "distanced": True, "seat": None}
+    assert roster["3-1"][1]["seat"] == 3
+
+
+def test_english_and_spaced_headers():
+    roster = parse_roster(csv_bytes("Class,Student Name\n1,Kim\n"), "roster.csv")
+    assert roster == {"1": [{"name": "Kim", "number": "", "distanced": False, "seat": None}]}
+
+    roster = parse_roster(csv_bytes("반,학생 이름,번호\n1,김,1\n"), "roster.csv")
+    assert [r["name"] for r in roster["1"]] == ["김"]
+
+
+def test_header_without_name_column_rejected():
+    with pytest.raises(ValueError, match="이름 열을 찾을 수 없습니다"):
+        parse_roster(csv_bytes("반,학생,번호\n1,김,1\n"), "roster.csv")
+
+
+def test_title_rows_before_header_skipped():
+    roster = parse_roster(csv_bytes("3학년 1반 명단\n\n반,번호,이름\n1,1,가\n"), "roster.csv")
+    assert roster == {"1": [{"name": "가", "number": "1", "distanced": False, "seat": None}]}
+
+
+def test_title_row_without_header_rejected():
+    with pytest.raises(ValueError, match="이름 열을 찾을 수 없습니다"):
+        parse_roster(csv_bytes("3학년 1반 명단\n반,번호,학생\n1,1,가\n"), "roster.csv")
+
+
+def test_headerless_multi_column_row_rejected_after_search_rows():
+    names = "\n".join(f"학생{i}" for i in range(8))
+    with pytest.raises(ValueError, match="이름 열을 찾을 수 없습니다"):
+        parse_roster(csv_bytes(names + "\n1,가\n"), "roster.csv")
+
+
+def test_long_single_column_without_header():
+    names = [f"학생{i}" for i in range(8)]
+    roster = parse_roster(csv_bytes("\n".join(names) + "\n"), "roster.csv")
+    assert [r["name"] for r in roster[""]] == names
+
+
+def test_single_column_without_header():
+    roster = parse_roster(csv_bytes("김자두\n\n백레몬\n"), "roster.csv")
+    assert [r["name"] for r in roster[""]] == ["김자두", "백레몬"]
+
+
+def test_cp949_and_utf8_bom():
+    text = "반,이름\n1,김자두\n"
+    for data in (csv_bytes(text, "cp949"), csv_bytes(text, "utf-8-sig")):
+        assert parse_roster(data, "roster.csv")["1"][0]["name"] == "김자두"
+
+
+def test_sorted_by_number():
+    roster = parse_roster(csv_bytes("번호,이름\n10,다\n2,나\n,라\n1,가\n"), "roster.csv")
+    assert [r["name"] for r in roster[""]] == ["가", "나", "다", "라"]
+
+
+def test_seats_are_one_based_and_range_checked():
+    roster = parse_roster(csv_bytes("이름,자리\n가,1\n나,30\n다,31\n라,1\n"), "roster.csv")
+    package = build_class_packages(roster, 'default', 5, 6)[""]
+
+    assert package["pre_assigned_seats"] == {0: "가", 29: "나"}
+    assert find_seat_conflicts(roster[""], 'default', 5, 6) == [
+        "다: 31번 자리 없음 (전체 30석)",
+        "라: 1번 자리는 가 학생이 먼저 지정",
+    ]
+
+
+def test_non_decimal_digits_ignored():
+    # '²' 는 isdigit 으로는 숫자지만 int() 로 바꿀 수 없음
+    roster = parse_roster(csv_bytes("번호,이름,자리\n²,가,²\n1,나,3\n"), "roster.csv")
+
+    assert [(r["name"], r["seat"]) for r in roster[""]] == [("나", 3), ("가", None)]
+
+
+def test_duplicate_names_get_numbers():
+    roster = parse_roster(csv_bytes("번호,이름\n3,김민수\n12,김민수\n5,이하늘\n"), "roster.csv")
+
+    assert find_duplicate_names(roster[""]) == ["김민수"]
+    assert build_class_packages(roster, 'default', 5, 6)[""]["students"] == ["김민수(3)", "이하늘", "김민수(12)"]
+
+
+def test_duplicate_renaming_never_collides_with_numbers():
+    # 순번으로 붙인 이름이 다른 학생의 실제 번호와 겹치는 경우
+    students = class_students("번호,이름\n,A\n2,A\n,A\n")
+    assert len(students) == 3
+    assert len(set(students)) == 3
+
+
+def test_duplicate_renaming_with_shared_number():
+    students = class_students("번호,이름,띄우기\n1,A,O\n1,A,\n")
+    assert students == ["A(1)", "A(1-2)"]
+
+
+def test_duplicate_renaming_avoids_existing_names():
+    students = class_students("번호,이름\n1,A\n1,A(1)\n2,A\n")
+    assert len(set(students)) == 3
+    assert "A(1)" in students
+
+
+def test_unsupported_extension():
+    with pytest.raises(ValueError, match="지원하지 않는 파일 형식"):
+        parse_roster(b"", "roster.txt")
+
+
+def test_class_sort_key_numeric():
+    assert sorted(["10반", "2반", "1반", ""], key=class_sort_key) == ["", "1반", "2반", "10반"]
+    assert sorted(["3-10", "3-2", "10-1"], key=class_sort_key) == ["3-2", "3-10", "10-1"]
+
+
+def test_file_hash_depends_on_content():
+    assert compute_file_hash(b"a") == compute_file_hash(b"a")
+    assert compute_file_hash(b"a") != compute_file_hash(b"b")
+
+
+def test_xlsx_read_only_parse():
+    openpyxl = pytest.importorskip("openpyxl")
+
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.append(["반", "번호", "이름"])
+    worksheet.append(["3-1", 2.0, "백레몬"])
+    worksheet.append(["3-1", 1, "김자두"])
+    output = io.BytesIO()
+    workbook.save(output)
+
+    roster = parse_roster(output.getvalue(), "roster.xlsx")
+    assert [(r["number"], r["name"]) for r in roster["3-1"]] == [("1", "김자두"), ("2", "백레몬")]
@@ -0,0 +1,37 @@
+"""
+자리 배치도 좌표 계산 테스트
+"""
+import pytest
+
+from utils.seat_layout import get_seat_grid
+
+LAYOUTS = [(layout_type, rows, cols) for layout_type in ('default', 'pairs') for rows in (1, 3, 10) for cols in (1, 2, 7)]
+
+
+@pytest.mark.parametrize("layout_type, rows, cols", LAYOUTS)
+def test_every_seat_shown_once(layout_type, rows, cols):
+    total_seats = rows * cols * 2 if layout_type == 'pairs' else rows * cols
+    grid, column_labels, row_labels = get_seat_grid(layout_type, rows, cols)
+
+    assert sorted(index for row in grid for index in row) == list(range(total_seats))
+    assert len(row_labels) == len(grid)
+    assert sum(span for _, span, _ in column_labels) == len(grid[0])
+
+
+@pytest.mark.parametrize("layout_type, rows, cols", LAYOUTS)
+def test_teacher_view_is_rotated_student_view(layout_type, rows, cols):
+    student_grid, student_columns, student_rows = get_seat_grid(layout_type, rows, cols, False)
+    teacher_grid, teacher_columns, teacher_rows = get_seat_grid(layout_type, rows, cols, True)
+
+    assert teacher_grid == [row[::-1] for row in student_grid[::-1]]
+    assert teacher_rows == student_rows[::-1]
+    assert [label for _, _, label in teacher_columns] == [label for _, _, label in student_columns][::-1]
+
+
+def test_pairs_sections_are_columns():
+    # 짝꿍형: rows 는 분단 수, cols 는 분단별 행 수
+    grid, column_labels, row_labels = get_seat_grid('pairs', 3, 2)
+
+    assert grid == [[0, 1, 4, 5, 8, 9], [2, 3, 6, 7, 10, 11]]
+    assert [label for _, _, label in column_labels] == ['1분단', '2분단', '3분단']
+    assert row_labels == ['1행', '2행']
@@ -0,0 +1,256 @@
+"""
+자리 배치 알고리즘 속성(property) 및 규모 테스트
+
+무작위 배치 조건을 시드별로 생성해 generate_seating_arrangement 의
+불변 조건을 확인하고, 기준 구현(reference_seating)과 결과를 비교합니다.
+"""
+import math
+import random
+import time
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from utils import seating_algorithm
+from utils.seating_algorithm import generate_seating_arrangement
+from utils.seat_layout import get_seat_grid
+from tests.reference_seating import reference_generate_seating_arrangement
+
+# 시드 하나가 무작위 배치 조건 하나
+CASE_SEEDS = range(300)
+
+# 규모 테스트 교실 한 변 크기 (자리 400 ~ 25600개)
+SCALING_SIDES = [20, 40, 80, 160]
+
+# 실행 시간 측정은 한 단계 더 큰 교실까지 (자리 102400개)
+RUNTIME_SIDES = SCALING_SIDES + [320]
+
+# is_too_close 로 막히는 자리는 자기 자신 포함 최대 13개
+MAX_BLOCKED_PER_SEAT = 13
+
+
+def total_seat_count(layout_type: str, rows: int, cols: int) -> int:
+    """배치 유형별 전체 자리 수"""
+    return rows * cols * 2 if layout_type == 'pairs' else rows * cols
+
+
+def distanced_capacity(available: int) -> int:
+    """
+    남은 자리 수에서 자리 띄우기가 항상 성공하는 대상 학생 수
+
+    한 자리는 최대 13개 자리를 막으므로, 남은 자리 n 개에서는
+    어떤 순서로 앉혀도 ceil(n / 13) 명까지 서로 띄워 앉힐 수 있습니다.
+    """
+    return math.ceil(available / MAX_BLOCKED_PER_SEAT)
+
+
+def rendered_positions(layout_type: str, rows: int, cols: int) -> Dict[int, Tuple[int, int]]:
+    """화면/엑셀/인쇄물과 같은 학생 기준 배치도에서 자리 인덱스별 (행, 열)"""
+    grid, _, _ = get_seat_grid(layout_type, rows, cols)
+    return {index: (r, c) for r, row in enumerate(grid) for c, index in enumerate(row)}
+
+
+def seats_too_close(first: Tuple[int, int], second: Tuple[int, int]) -> bool:
+    """인접(대각선 포함)하거나 같은 행/열에서 2칸 이내인지 확인"""
+    dr = abs(first[0] - second[0])
+    dc = abs(first[1] - second[1])
+    return (dr <= 1 and dc <= 1) or (dr == 0 and dc <= 2) or (dc == 0 and dr <= 2)
+
+
+def random_case(seed: int) -> Dict[str, Any]:
+    """시드로부터 무작위 배치 조건 생성"""
+    rng = random.Random(seed)
+    layout_type = rng.choice(['default', 'pairs'])
+    rows = rng.randint(1, 10)
+    cols = rng.randint(1, 10)
+    total_seats = total_seat_count(layout_type, rows, cols)
+
+    # 학생 수는 자리 수보다 적거나 많을 수 있음
+    students = [f"학생{i}" for i in range(rng.randint(0, total_seats + 5))]
+
+    seats = list(range(total_seats))
+    rng.shuffle(seats)
+    disabled_seats = seats[:rng.randint(0, total_seats // 4)]
+    free_seats = seats[len(disabled_seats):]
+
+    pre_assigned_count = rng.randint(0, min(3, len(free_seats), len(students)))
+    pre_assigned_students = rng.sample(students, pre_assigned_count)
+    pre_assigned_seats = dict(zip(free_seats[:pre_assigned_count], pre_assigned_students))
+
+    # 자리 띄우기 대상은 배치가 보장되는 수 이내로 생성
+    available = len(free_seats) - pre_assigned_count
+    distanced_limit = min(8, len(students), distanced_capacity(available))
+    distanced_count = rng.randint(min(2, distanced_limit), distanced_limit)
+    distanced_students = rng.sample(students, distanced_count)
+
+    return {
+        "students": students,
+        "layout_type": layout_type,
+        "rows": rows,
+        "cols": cols,
+        "pre_assigned_seats": pre_assigned_seats,
+        "disabled_seats": disabled_seats,
+        "distanced_students": distanced_students,
+    }
+
+
+def arrange(seed: int, case: Dict[str, Any], generator=generate_seating_arrangement) -> Dict[int, str]:
+    """같은 시드에서 배치 실행 (입력 조건은 복사해서 전달)"""
+    random.seed(seed)
+    return generator(
+        list(case["students"]),
+        case["layout_type"],
+        case["rows"],
+        case["cols"],
+        dict(case["pre_assigned_seats"]),
+        list(case["disabled_seats"]),
+        list(case["distanced_students"]),
+    )
+
+
+@pytest.mark.parametrize("seed", CASE_SEEDS)
+def test_students_placed_at_most_once(seed):
+    case = random_case(seed)
+    result = arrange(seed, case)
+
+    placed = list(result.values())
+    assert len(placed) == len(set(placed))
+    assert set(placed) <= set(case["students"])
+
+    total_seats = total_seat_count(case["layout_type"], case["rows"], case["cols"])
+    assert all(0 <= index < total_seats for index in result)
+
+
+@pytest.mark.parametrize("seed", CASE_SEEDS)
+def test_everyone_placed_when_seats_suffice(seed):
+    case = random_case(seed)
+    result = arrange(seed, case)
+
+    total_seats = total_seat_count(case["layout_type"], case["rows"], case["cols"])
+    open_seats = total_seats - len(case["disabled_seats"])
+    if len(case["students"]) <= open_seats:
+        assert sorted(result.values()) == sorted(case["students"])
+    else:
+        assert len(result) == open_seats
+
+
+@pytest.mark.parametrize("seed", CASE_SEEDS)
+def test_pre_assigned_seats_respected(seed):
+    case = random_case(seed)
+    result = arrange(seed, case)
+
+    for index, student in case["pre_assigned_seats"].items():
+        assert result[index] == student
+
+
+@pytest.mark.parametrize("seed", CASE_SEEDS)
+def test_disabled_seats_empty(seed):
+    case = random_case(seed)
+    result = arrange(seed, case)
+
+    assert not set(case["disabled_seats"]) & set(result)
+
+
+@pytest.mark.parametrize("seed", CASE_SEEDS)
+def test_distanced_students_kept_apart(seed):
+    case = random_case(seed)
+    result = arrange(seed, case)
+
+    pre_assigned_students = set(case["pre_assigned_seats"].values())
+    distanced = [s for s in case["distanced_students"] if s not in pre_assigned_students]
+
+    # 생성기 내부 좌표가 아니라 실제로 보이는 배치도 위치로 확인
+    positions = rendered_positions(case["layout_type"], case["rows"], case["cols"])
+    seat_of = {student: index for index, student in result.items()}
+    placed = [positions[seat_of[s]] for s in distanced]
+    for i, first in enumerate(placed):
+        for second in placed[i + 1:]:
+            assert not seats_too_close(first, second)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_pairs_distancing_matches_printed_chart(seed):
+    # 짝꿍형 3분단 x 2행: 생성기 좌표와 배치도 방향이 어긋나면 옆자리에 앉게 됨
+    case = {
+        "students": ["가", "나", "다"],
+        "layout_type": 'pairs',
+        "rows": 3,
+        "cols": 2,
+        "pre_assigned_seats": {},
+        "disabled_seats": [],
+        "distanced_students": ["가", "나"],
+    }
+    result = arrange(seed, case)
+
+    positions = rendered_positions('pairs', 3, 2)
+    seat_of = {student: index for index, student in result.items()}
+    assert not seats_too_close(positions[seat_of["가"]], positions[seat_of["나"]])
+
+
+@pytest.mark.parametrize("seed", CASE_SEEDS)
+def test_matches_reference_implementation(seed):
+    case = random_case(seed)
+
+    assert arrange(seed, case) == arrange(seed, case, reference_generate_seating_arrangement)
+
+
+def scaling_case(side: int) -> Dict[str, Any]:
+    """side x side 기본형 배치 조건 (자리 띄우기 대상 5%, 비활성 자리 2%)"""
+    total_seats = side * side
+    students = [f"학생{i}" for i in range(total_seats)]
+    return {
+        "students": students,
+        "layout_type": 'default',
+        "rows": side,
+        "cols": side,
+        "pre_assigned_seats": {},
+        "disabled_seats": list(range(0, total_seats, 50)),
+        "distanced_students": students[:total_seats // 20],
+    }
+
+
+def fit_exponent(sizes: List[int], costs: List[float]) -> float:
+    """log-log 최소제곱 기울기 (cost ~ size ** k 의 k)"""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(cost) for cost in costs]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    numerator = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    denominator = sum((x - x_mean) ** 2 for x in xs)
+    return numerator / denominator
+
+
+def test_coordinate_lookups_linear_in_seats(monkeypatch):
+    # 좌표 계산 횟수는 시간 측정과 달리 실행 환경에 관계없이 일정
+    calls = [0]
+    original = seating_algorithm.get_seat_coordinates
+
+    def counting_get_seat_coordinates(*args):
+        calls[0] += 1
+        return original(*args)
+
+    monkeypatch.setattr(seating_algorithm, "get_seat_coordinates", counting_get_seat_coordinates)
+
+    costs = []
+    for side in SCALING_SIDES:
+        calls[0] = 0
+        arrange(0, scaling_case(side))
+        costs.append(calls[0])
+
+    assert fit_exponent([side * side for side in SCALING_SIDES], costs) < 1.1
+
+
+def test_runtime_near_linear_in_seats():
+    # 공유 CI 에서도 흔들리지 않도록 5개 크기의 최솟값으로 기울기를 맞추고 여유 있게 판정
+    # (현재 약 1.1, O(n^2) 항이 섞이면 큰 교실에서 2 가까이 올라감)
+    runtimes = []
+    for side in RUNTIME_SIDES:
+        case = scaling_case(side)
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            arrange(0, case)
+            best = min(best, time.perf_counter() - start)
+        runtimes.append(best)
+
+    assert fit_exponent([side * side for side in RUNTIME_SIDES], runtimes) < 1.5
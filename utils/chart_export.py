@@ -0,0 +1,289 @@
+"""
+인쇄용 자리 배치도(SVG/PDF) 내보내기 모듈
+"""
+import zlib
+from typing import Any, Dict, List, Tuple
+from xml.sax.saxutils import escape
+
+from utils.seat_layout import get_seat_grid
+
+# 용지 설정 (A4 가로, 단위 pt)
+PAGE_WIDTH = 842
+PAGE_HEIGHT = 595
+MARGIN = 36
+
+TITLE_HEIGHT = 36
+LABEL_SIZE = 24
+DESK_HEIGHT = 28
+SEAT_GAP = 4
+AISLE_GAP = 18
+
+# 이름 글자 크기 하한과 줄 간격 (하한에서도 넘치는 글자는 자리 칸에서 잘림)
+MIN_NAME_SIZE = 6.0
+LINE_SPACING = 1.2
+
+# PDF 기본 한글 글꼴 (뷰어 내장 CJK 글꼴 사용, 임베딩 없음)
+PDF_FONT_NAME = "HYGoThic-Medium"
+SVG_FONT_FAMILY = "'Malgun Gothic', AppleGothic, NanumGothic, sans-serif"
+
+
+def create_chart_layout(
+    seating_arrangement: Dict[int, str],
+    layout_type: str,
+    rows: int,
+    cols: int,
+    is_teacher_view: bool = False,
+    title: str = ""
+) -> Dict[str, Any]:
+    """
+    자리 배치 결과를 한 페이지 분량의 도형 목록으로 변환
+
+    좌표는 페이지 왼쪽 위를 원점으로 하는 pt 단위입니다.
+    교사 기준 보기는 배치도 전체를 교사 시선으로 돌린 것이므로
+    인쇄물에서는 교탁이 아래쪽에 위치합니다 (화면에서는 항상 위쪽).
+
+    Args:
+        seating_arrangement: 자리 배치 결과 {자리인덱스: 학생명}
+        layout_type: 배치 유형 ('default' 또는 'pairs')
+        rows: 행 수
+        cols: 열 수
+        is_teacher_view: 교사 기준 보기 여부
+        title: 페이지 제목 (그룹명 등)
+
+    Returns:
+        {"boxes": [(x, y, w, h, 글자, 글자크기)], "labels": [(x, y, 글자, 글자크기)]}
+    """
+    grid, column_labels, row_labels = get_seat_grid(layout_type, rows, cols, is_teacher_view)
+
+    if layout_type == 'pairs':
+        grid_cols = rows * 2
+        pair_size = 2
+    else:
+        grid_cols = cols
+        pair_size = grid_cols
+    aisle_count = (grid_cols - 1) // pair_size
+    grid_rows = len(row_labels)
+
+    # 사용 가능한 영역에 맞춰 자리 크기 결정
+    top = MARGIN + (TITLE_HEIGHT if title else 0)
+    area_width = PAGE_WIDTH - 2 * MARGIN - LABEL_SIZE
+    area_height = PAGE_HEIGHT - top - MARGIN - LABEL_SIZE - DESK_HEIGHT - SEAT_GAP * 2
+    cell_width = (area_width - aisle_count * AISLE_GAP) / grid_cols
+    cell_height = min(area_height / grid_rows, cell_width * 0.6)
+
+    grid_width = cell_width * grid_cols + aisle_count * AISLE_GAP
+    grid_height = cell_height * grid_rows
+    left = MARGIN + LABEL_SIZE + (area_width - grid_width) / 2
+
+    # 교탁은 학생 기준 위쪽, 교사 기준 아래쪽
+    if is_teacher_view:
+        grid_top = top + LABEL_SIZE
+        desk_top = grid_top + grid_height + SEAT_GAP * 2
+    else:
+        desk_top = top
+        grid_top = top + DESK_HEIGHT + SEAT_GAP * 2 + LABEL_SIZE
+
+    def column_x(grid_col: int) -> float:
+        return left + grid_col * cell_width + (grid_col // pair_size) * AISLE_GAP
+
+    longest_name = max((len(name) for name in seating_arrangement.values()), default=1)
+    name_size = max(MIN_NAME_SIZE, min(14.0, cell_height * 0.4, (cell_width - SEAT_GAP * 2) / max(longest_name, 3)))
+    label_size = 10.0
+
+    boxes = []
+    labels = []
+
+    if title:
+        labels.append((PAGE_WIDTH / 2, MARGIN + TITLE_HEIGHT / 2, title, 16.0))
+
+    desk_width = min(grid_width / 3, 160)
+    boxes.append((left + grid_width / 2 - desk_width / 2, desk_top, desk_width, DESK_HEIGHT, "교탁", 12.0))
+
+    for start_col, span, text in column_labels:
+        x = column_x(start_col)
+        width = column_x(start_col + span - 1) + cell_width - x
+        labels.append((x + width / 2, grid_top - LABEL_SIZE / 2, text, label_size))
+
+    for r, text in enumerate(row_labels):
+        labels.append((left - LABEL_SIZE / 2 - SEAT_GAP, grid_top + r * cell_height + cell_height / 2, text, label_size))
+
+    for r, row_indices in enumerate(grid):
+        for c, index in enumerate(row_indices):
+            boxes.append((
+                column_x(c) + SEAT_GAP / 2,
+                grid_top + r * cell_height + SEAT_GAP / 2,
+                cell_width - SEAT_GAP,
+                cell_height - SEAT_GAP,
+                seating_arrangement.get(index, ''),
+                name_size
+            ))
+
+    return {"boxes": boxes, "labels": labels}
+
+
+def _text_width(text: str, size: float) -> float:
+    """글자 폭 추정 (영문/숫자 반각, 그 외 전각)"""
+    return sum(0.5 if ord(ch) < 128 else 1.0 for ch in text) * size
+
+
+def _name_lines(x: float, y: float, w: float, h: float, text: str, size: float) -> List[Tuple[float, float, str, float]]:
+    """
+    자리 칸 안에 들어가도록 이름을 한 줄 또는 두 줄로 배치
+
+    한 줄에 들어가지 않으면 괄호 앞('김민수(12)')이나 가운데에서 나누고
+    두 줄이 칸에 맞도록 글자 크기를 줄입니다.
+
+    Returns:
+        [(가운데 x, 가운데 y, 글자, 글자크기)]
+    """
+    width = w - SEAT_GAP
+    if _text_width(text, size) <= width or len(text) < 2:
+        return [(x + w / 2, y + h / 2, text, size)]
+
+    split = text.find("(") if text.find("(") > 0 else (len(text) + 1) // 2
+    lines = [text[:split], text[split:]]
+    widest = max(_text_width(line, 1.0) for line in lines)
+    size = max(MIN_NAME_SIZE, min(size, width / widest, h / (2 * LINE_SPACING)))
+
+    line_height = size * LINE_SPACING
+    return [
+        (x + w / 2, y + h / 2 + (i - 0.5) * line_height, line, size)
+        for i, line in enumerate(lines)
+    ]
+
+
+def _svg_text(x: float, y: float, text: str, size: float) -> str:
+    """SVG 가운데 정렬 텍스트 요소"""
+    return (
+        f'<text x="{x:.1f}" y="{y:.1f}" font-size="{size:.1f}" '
+        f'text-anchor="middle" dominant-baseline="central">{escape(text)}</text>'
+    )
+
+
+def create_svg_file(chart_layout: Dict[str, Any]) -> bytes:
+    """
+    SVG 파일 생성
+
+    Args:
+        chart_layout: create_chart_layout 결과
+
+    Returns:
+        SVG 파일 바이트 데이터
+    """
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{PAGE_WIDTH}pt" height="{PAGE_HEIGHT}pt" '
+        f'viewBox="0 0 {PAGE_WIDTH} {PAGE_HEIGHT}" font-family="{escape(SVG_FONT_FAMILY)}">',
+        f'<rect width="{PAGE_WIDTH}" height="{PAGE_HEIGHT}" fill="white"/>'
+    ]
+
+    for i, (x, y, w, h, text, size) in enumerate(chart_layout["boxes"]):
+        rect = f'x="{x:.1f}" y="{y:.1f}" width="{w:.1f}" height="{h:.1f}"'
+        parts.append(f'<rect {rect} fill="none" stroke="black" stroke-width="0.8"/>')
+        if text:
+            # 긴 이름이 옆 자리로 넘치지 않도록 자리 칸으로 자름
+            parts.append(f'<clipPath id="seat{i}"><rect {rect}/></clipPath>')
+            parts.append(f'<g clip-path="url(#seat{i})">')
+            parts.extend(_svg_text(*line) for line in _name_lines(x, y, w, h, text, size))
+            parts.append('</g>')
+
+    for x, y, text, size in chart_layout["labels"]:
+        parts.append(_svg_text(x, y, text, size))
+
+    parts.append('</svg>')
+    return "\n".join(parts).encode("utf-8")
+
+
+def _pdf_text(x: float, y: float, text: str, size: float) -> str:
+    """PDF 가운데 정렬 텍스트 명령 (y 는 위쪽 기준 좌표)"""
+    pdf_x = x - _text_width(text, size) / 2
+    pdf_y = PAGE_HEIGHT - y - size * 0.35
+    return f"BT /F1 {size:.1f} Tf {pdf_x:.1f} {pdf_y:.1f} Td <{text.encode('utf-16-be').hex()}> Tj ET"
+
+
+def _pdf_page_content(chart_layout: Dict[str, Any]) -> bytes:
+    """한 페이지 분량의 PDF 콘텐츠 스트림"""
+    commands = ["0.8 w"]
+
+    for x, y, w, h, text, size in chart_layout["boxes"]:
+        rect = f"{x:.1f} {PAGE_HEIGHT - y - h:.1f} {w:.1f} {h:.1f} re"
+        commands.append(f"{rect} S")
+        if text:
+            # 긴 이름이 옆 자리로 넘치지 않도록 자리 칸으로 자름
+            commands.append(f"q {rect} W n")
+            commands.extend(_pdf_text(*line) for line in _name_lines(x, y, w, h, text, size))
+            commands.append("Q")
+
+    for x, y, text, size in chart_layout["labels"]:
+        commands.append(_pdf_text(x, y, text, size))
+
+    return "\n".join(commands).encode("ascii")
+
+
+def create_pdf_file(chart_layouts: List[Dict[str, Any]]) -> bytes:
+    """
+    PDF 파일 생성 (자리 배치도 하나당 한 페이지)
+
+    여러 반의 배치도를 넘기면 한 번에 여러 페이지 문서로 만듭니다.
+
+    Args:
+        chart_layouts: create_chart_layout 결과 목록 (비어 있으면 ValueError)
+
+    Returns:
+        PDF 파일 바이트 데이터
+    """
+    if not chart_layouts:
+        raise ValueError("PDF로 만들 자리 배치도가 없습니다.")
+
+    # 객체 번호: 1 카탈로그, 2 페이지 트리, 3~5 글꼴, 6 이후 페이지/콘텐츠 쌍
+    page_ids = [6 + i * 2 for i in range(len(chart_layouts))]
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        (
+            f"<< /Type /Pages /Kids [{' '.join(f'{p} 0 R' for p in page_ids)}] "
+            f"/Count {len(page_ids)} >>"
+        ).encode("ascii"),
+        (
+            f"<< /Type /Font /Subtype /Type0 /BaseFont /{PDF_FONT_NAME} "
+            f"/Encoding /UniKS-UCS2-H /DescendantFonts [4 0 R] >>"
+        ).encode("ascii"),
+        (
+            f"<< /Type /Font /Subtype /CIDFontType0 /BaseFont /{PDF_FONT_NAME} "
+            f"/CIDSystemInfo << /Registry (Adobe) /Ordering (Korea1) /Supplement 1 >> "
+            f"/FontDescriptor 5 0 R /DW 1000 /W [1 95 500] >>"
+        ).encode("ascii"),
+        # /Flags 4 는 Symbolic 비트 (Serif 아님): 임베딩하지 않는 Adobe-Korea1 CID 글꼴의 통상 값
+        (
+            f"<< /Type /FontDescriptor /FontName /{PDF_FONT_NAME} /Flags 4 "
+            f"/FontBBox [-6 -145 1003 880] /ItalicAngle 0 /Ascent 880 /Descent -120 "
+            f"/CapHeight 880 /StemV 93 >>"
+        ).encode("ascii"),
+    ]
+
+    for page_id, chart_layout in zip(page_ids, chart_layouts):
+        content = zlib.compress(_pdf_page_content(chart_layout))
+        objects.append((
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>"
+        ).encode("ascii"))
+        objects.append(
+            f"<< /Length {len(content)} /Filter /FlateDecode >>\nstream\n".encode("ascii")
+            + content + b"\nendstream"
+        )
+
+    output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode("ascii") + body + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("ascii")
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode("ascii")
+    output += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n"
+    ).encode("ascii")
+
+    return bytes(output)
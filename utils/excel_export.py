@@ -4,6 +4,8 @@
 import pandas as pd
 from typing import Dict, List
 
+from utils.seat_layout import get_seat_grid
+
 def create_excel_data(
     seating_arrangement: Dict[int, str],
     layout_type: str,
@@ -24,69 +26,26 @@ def create_excel_data(
     Returns:
         엑셀 데이터 (2차원 리스트)
     """
+    grid, column_labels, row_labels = get_seat_grid(layout_type, rows, cols, is_teacher_view)
     data = []
     
     if layout_type == 'pairs':
         # 짝꿍형 배치
-        sections = rows
-        rows_per_section = cols
-        
-        # 헤더 생성
         header1 = ['']
         header2 = ['행']
-        for s in range(sections):
-            section_label = f'{sections - s}분단' if is_teacher_view else f'{s + 1}분단'
+        for _, _, section_label in column_labels:
             header1.extend([section_label, ''])
             header2.extend(['왼쪽', '오른쪽'])
         
         data.append(header1)
         data.append(header2)
-        
-        # 데이터 행 생성
-        for r in range(rows_per_section):
-            row_label = f'{rows_per_section - r}행' if is_teacher_view else f'{r + 1}행'
-            row_data = [row_label]
-            
-            for s in range(sections):
-                read_section = sections - 1 - s if is_teacher_view else s
-                read_row = rows_per_section - 1 - r if is_teacher_view else r
-                
-                student_left_index = (read_section * rows_per_section * 2) + (read_row * 2)
-                student_right_index = student_left_index + 1
-                
-                left_index = student_right_index if is_teacher_view else student_left_index
-                right_index = student_left_index if is_teacher_view else student_right_index
-                
-                left_student = seating_arrangement.get(left_index, '')
-                right_student = seating_arrangement.get(right_index, '')
-                
-                row_data.extend([left_student, right_student])
-            
-            data.append(row_data)
-    
     else:
         # 기본형 배치
-        # 헤더 생성
-        header = [' ']
-        for c in range(cols):
-            col_label = f'{cols - c}열' if is_teacher_view else f'{c + 1}열'
-            header.append(col_label)
-        data.append(header)
-        
-        # 데이터 행 생성
-        for r in range(rows):
-            row_label = f'{rows - r}행' if is_teacher_view else f'{r + 1}행'
-            row_data = [row_label]
-            
-            for c in range(cols):
-                read_row = rows - 1 - r if is_teacher_view else r
-                read_col = cols - 1 - c if is_teacher_view else c
-                
-                index = read_row * cols + read_col
-                student = seating_arrangement.get(index, '')
-                row_data.append(student)
-            
-            data.append(row_data)
+        data.append([' '] + [col_label for _, _, col_label in column_labels])
+    
+    # 데이터 행 생성
+    for row_label, row_indices in zip(row_labels, grid):
+        data.append([row_label] + [seating_arrangement.get(index, '') for index in row_indices])
     
     return data
 
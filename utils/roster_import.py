@@ -0,0 +1,346 @@
+"""
+명단 파일(CSV/XLSX) 가져오기 모듈
+"""
+import codecs
+import csv
+import hashlib
+import io
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.data_manager import create_data_package
+
+# 헤더 별칭 (소문자, 공백 제거 기준)
+NAME_HEADERS = {"이름", "성명", "학생명", "학생이름", "name", "studentname"}
+CLASS_HEADERS = {"반", "학급", "class"}
+NUMBER_HEADERS = {"번호", "학번", "number", "no"}
+DISTANCED_HEADERS = {"띄우기", "자리띄우기", "distanced"}
+SEAT_HEADERS = {"지정자리", "자리", "seat"}
+
+# 플래그 열에서 참으로 인정하는 값
+TRUE_FLAGS = {"o", "v", "y", "yes", "true", "1", "예", "✓", "✔"}
+
+# 제목 행 등을 건너뛰며 헤더를 찾는 앞쪽 행 수
+HEADER_SEARCH_ROWS = 5
+
+# CSV 인코딩 판별에 사용하는 앞부분 크기
+ENCODING_SNIFF_BYTES = 64 * 1024
+
+
+def compute_file_hash(file_bytes: bytes) -> str:
+    """파일 내용의 SHA-256 해시 (캐시 키로 사용)"""
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+def _detect_csv_encoding(file_bytes: bytes) -> str:
+    """CSV 앞부분만 디코딩해 보고 인코딩 결정 (UTF-8 실패 시 CP949)"""
+    head = file_bytes[:ENCODING_SNIFF_BYTES]
+    try:
+        # 잘린 멀티바이트 문자는 final=False 로 허용
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def _iter_csv_rows(file_bytes: bytes) -> Iterator[Tuple[Any, ...]]:
+    """CSV 파일을 한 줄씩 읽어 행을 반환"""
+    encoding = _detect_csv_encoding(file_bytes)
+    stream = io.TextIOWrapper(io.BytesIO(file_bytes), encoding=encoding, newline="")
+    for row in csv.reader(stream):
+        yield tuple(row)
+
+
+def _iter_xlsx_rows(file_bytes: bytes) -> Iterator[Tuple[Any, ...]]:
+    """XLSX 첫 번째 시트를 읽기 전용 모드로 한 줄씩 읽어 행을 반환"""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True)
+    try:
+        worksheet = workbook.worksheets[0]
+        for row in worksheet.iter_rows(values_only=True):
+            yield row
+    finally:
+        workbook.close()
+
+
+def iter_roster_rows(file_bytes: bytes, filename: str) -> Iterator[Tuple[Any, ...]]:
+    """
+    파일 확장자에 따라 명단 파일의 행을 스트리밍으로 반환
+
+    Args:
+        file_bytes: 업로드된 파일 바이트 데이터
+        filename: 파일명 (확장자 판별용)
+
+    Returns:
+        행 튜플 이터레이터
+    """
+    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if extension == "csv":
+        return _iter_csv_rows(file_bytes)
+    if extension in ("xlsx", "xlsm"):
+        return _iter_xlsx_rows(file_bytes)
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {filename}")
+
+
+def _cell_text(value: Any) -> str:
+    """셀 값을 문자열로 정리 (엑셀 숫자 12.0 -> '12')"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def _find_column(header: List[str], aliases: set) -> Optional[int]:
+    """헤더에서 별칭에 해당하는 열 위치 탐색"""
+    for i, title in enumerate(header):
+        if title in aliases:
+            return i
+    return None
+
+
+def _header_columns(cells: List[str]) -> Optional[Dict[str, Optional[int]]]:
+    """행이 헤더이면 항목별 열 위치, 아니면 None"""
+    header = [cell.lower().replace(" ", "") for cell in cells]
+    name_col = _find_column(header, NAME_HEADERS)
+    if name_col is None:
+        return None
+    return {
+        "name": name_col,
+        "class": _find_column(header, CLASS_HEADERS),
+        "number": _find_column(header, NUMBER_HEADERS),
+        "distanced": _find_column(header, DISTANCED_HEADERS),
+        "seat": _find_column(header, SEAT_HEADERS),
+    }
+
+
+def _headerless_name(cells: List[str]) -> str:
+    """헤더 없는 명단의 이름 (이름 한 열만 허용)"""
+    filled = [cell for cell in cells if cell]
+    if len(filled) > 1:
+        raise ValueError(
+            "이름 열을 찾을 수 없습니다. 첫 줄에 다음 중 하나를 헤더로 적어 주세요: "
+            + ", ".join(sorted(NAME_HEADERS))
+        )
+    return filled[0]
+
+
+def _number_sort_key(record: Dict[str, Any]) -> Tuple[int, int]:
+    """번호 정렬 키 (번호 없는 학생은 뒤로)"""
+    number = record["number"]
+    return (0, int(number)) if number.isdecimal() else (1, 0)
+
+
+def parse_roster(file_bytes: bytes, filename: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    명단 파일을 한 번 읽어 반별 학생 목록으로 분리
+
+    앞쪽 몇 행 안에서 '이름' 열이 있는 행을 헤더로 사용하고, 그 위의
+    제목 행은 건너뜁니다. 헤더가 없으면 이름 한 열만 있는 명단으로 처리하며,
+    여러 칸이 채워진 행이 있으면 ValueError 를 발생시킵니다.
+
+    Args:
+        file_bytes: 업로드된 파일 바이트 데이터
+        filename: 파일명 (확장자 판별용)
+
+    Returns:
+        반별 학생 정보 {반: [{"name", "number", "distanced", "seat"}]}
+    """
+    roster: Dict[str, List[Dict[str, Any]]] = {}
+    columns: Optional[Dict[str, Optional[int]]] = None
+    headerless = False
+    leading_rows: List[List[str]] = []
+
+    def add_record(cells: List[str]) -> None:
+        if headerless:
+            roster.setdefault("", []).append(
+                {"name": _headerless_name(cells), "number": "", "distanced": False, "seat": None}
+            )
+            return
+
+        def get(key: str) -> str:
+            col = columns[key]
+            return cells[col] if col is not None and col < len(cells) else ""
+
+        name = get("name")
+        if not name:
+            return
+
+        seat_text = get("seat")
+        roster.setdefault(get("class"), []).append({
+            "name": name,
+            "number": get("number"),
+            "distanced": get("distanced").lower() in TRUE_FLAGS,
+            "seat": int(seat_text) if seat_text.isdecimal() else None,
+        })
+
+    try:
+        for row in iter_roster_rows(file_bytes, filename):
+            cells = [_cell_text(value) for value in row]
+            if not any(cells):
+                continue
+
+            if columns is None and not headerless:
+                columns = _header_columns(cells)
+                if columns is not None:
+                    # 헤더 위의 제목 행은 버림
+                    leading_rows = []
+                    continue
+
+                leading_rows.append(cells)
+                if len(leading_rows) < HEADER_SEARCH_ROWS:
+                    continue
+
+                headerless = True
+                for leading_cells in leading_rows:
+                    add_record(leading_cells)
+                leading_rows = []
+                continue
+
+            add_record(cells)
+
+        # 헤더 검색 범위보다 짧은 헤더 없는 명단
+        if leading_rows:
+            headerless = True
+            for leading_cells in leading_rows:
+                add_record(leading_cells)
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"명단 파일 읽기 오류: {e}") from e
+
+    # 번호가 있으면 번호 순으로 정렬 (번호 없는 학생은 입력 순서 유지)
+    for records in roster.values():
+        records.sort(key=_number_sort_key)
+
+    return roster
+
+
+def class_sort_key(class_name: str) -> List[Any]:
+    """반 이름 정렬 키 (숫자 부분은 숫자로 비교: '2반' < '10반')"""
+    return [(0, int(part)) if part.isdigit() else (1, part) for part in re.split(r"(\d+)", class_name)]
+
+
+def find_duplicate_names(records: List[Dict[str, Any]]) -> List[str]:
+    """같은 반 안에서 중복된 이름 목록"""
+    seen = set()
+    duplicates = []
+    for record in records:
+        name = record["name"]
+        if name in seen and name not in duplicates:
+            duplicates.append(name)
+        seen.add(name)
+    return duplicates
+
+
+def _check_seat_requests(
+    records: List[Dict[str, Any]],
+    total_seats: int
+) -> Tuple[Dict[int, int], List[str]]:
+    """
+    지정 자리 요청 검사 (자리 번호는 화면과 같이 1번부터 시작)
+
+    Returns:
+        ({레코드 위치: 자리 인덱스}, [받아들이지 않은 요청 설명])
+    """
+    accepted: Dict[int, int] = {}
+    taken: Dict[int, str] = {}
+    rejected = []
+
+    for position, record in enumerate(records):
+        seat = record["seat"]
+        if seat is None:
+            continue
+        if not 1 <= seat <= total_seats:
+            rejected.append(f"{record['name']}: {seat}번 자리 없음 (전체 {total_seats}석)")
+        elif seat - 1 in taken:
+            rejected.append(f"{record['name']}: {seat}번 자리는 {taken[seat - 1]} 학생이 먼저 지정")
+        else:
+            accepted[position] = seat - 1
+            taken[seat - 1] = record["name"]
+
+    return accepted, rejected
+
+
+def find_seat_conflicts(
+    records: List[Dict[str, Any]],
+    layout_type: str,
+    rows: int,
+    cols: int
+) -> List[str]:
+    """같은 반 안에서 적용되지 않는 지정 자리 요청 목록 (범위 밖, 겹침)"""
+    total_seats = rows * cols * 2 if layout_type == 'pairs' else rows * cols
+    return _check_seat_requests(records, total_seats)[1]
+
+
+def build_class_packages(
+    roster: Dict[str, List[Dict[str, Any]]],
+    layout_type: str,
+    rows: int,
+    cols: int
+) -> Dict[str, Dict[str, Any]]:
+    """
+    반별 학생 목록을 create_data_package 형식의 데이터 패키지로 변환
+
+    자리 배치는 이름으로 학생을 구분하므로, 중복된 이름은
+    번호(없으면 순번)를 붙여 '김민수(12)' 형태로 구분합니다.
+    붙인 이름이 다른 학생과 겹치면 '김민수(12-2)' 처럼 한 번 더 구분합니다.
+    범위 밖이거나 이미 지정된 자리 요청은 빠지며, find_seat_conflicts 로 확인할 수 있습니다.
+
+    Args:
+        roster: parse_roster 결과
+        layout_type: 배치 유형
+        rows: 행 수
+        cols: 열 수
+
+    Returns:
+        반별 데이터 패키지 {반: 데이터 패키지}
+    """
+    total_seats = rows * cols * 2 if layout_type == 'pairs' else rows * cols
+    packages = {}
+
+    for class_name, records in roster.items():
+        duplicates = set(find_duplicate_names(records))
+        duplicate_counts: Dict[str, int] = {}
+
+        # 중복되지 않은 이름을 먼저 확보해 새 이름과 겹치지 않게 함
+        used_names = {record["name"] for record in records if record["name"] not in duplicates}
+
+        seat_indices, _ = _check_seat_requests(records, total_seats)
+        students = []
+        pre_assigned_seats = {}
+        distanced_students = []
+
+        for position, record in enumerate(records):
+            name = record["name"]
+            if name in duplicates:
+                duplicate_counts[name] = duplicate_counts.get(name, 0) + 1
+                label = record["number"] or str(duplicate_counts[name])
+                candidate = f"{name}({label})"
+                suffix = 2
+                while candidate in used_names:
+                    candidate = f"{name}({label}-{suffix})"
+                    suffix += 1
+                name = candidate
+                used_names.add(name)
+
+            students.append(name)
+            if record["distanced"]:
+                distanced_students.append(name)
+
+            if position in seat_indices:
+                pre_assigned_seats[seat_indices[position]] = name
+
+        packages[class_name] = create_data_package(
+            students,
+            layout_type,
+            rows,
+            cols,
+            pre_assigned_seats,
+            [],
+            distanced_students,
+            class_name
+        )
+
+    return packages
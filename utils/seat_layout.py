@@ -0,0 +1,74 @@
+"""
+자리 배치도 화면/출력 좌표 계산 모듈
+"""
+from typing import List, Tuple
+
+
+def get_seat_grid(
+    layout_type: str,
+    rows: int,
+    cols: int,
+    is_teacher_view: bool = False
+) -> Tuple[List[List[int]], List[Tuple[int, int, str]], List[str]]:
+    """
+    표시 위치별 자리 인덱스와 라벨 계산
+
+    화면 그리드, 엑셀, 인쇄용 배치도가 모두 이 함수의 방향 규칙을 따릅니다.
+    짝꿍형은 rows 가 분단 수, cols 가 분단별 행 수이며 분단마다 왼쪽/오른쪽
+    두 열을 차지합니다. 교사 기준 보기는 배치도 전체를 180도 돌린 모양입니다.
+
+    Args:
+        layout_type: 배치 유형 ('default' 또는 'pairs')
+        rows: 행 수 (짝꿍형은 분단 수)
+        cols: 열 수 (짝꿍형은 분단별 행 수)
+        is_teacher_view: 교사 기준 보기 여부
+
+    Returns:
+        (grid[표시 행][표시 열] = 자리 인덱스, [(시작 열, 열 개수, 열 라벨)], [행 라벨])
+    """
+    grid = []
+    column_labels = []
+
+    if layout_type == 'pairs':
+        sections = rows
+        rows_per_section = cols
+
+        for s in range(sections):
+            section_label = f'{sections - s}분단' if is_teacher_view else f'{s + 1}분단'
+            column_labels.append((s * 2, 2, section_label))
+
+        for r in range(rows_per_section):
+            row_indices = []
+            for s in range(sections):
+                read_section = sections - 1 - s if is_teacher_view else s
+                read_row = rows_per_section - 1 - r if is_teacher_view else r
+
+                student_left_index = (read_section * rows_per_section * 2) + (read_row * 2)
+                student_right_index = student_left_index + 1
+
+                left_index = student_right_index if is_teacher_view else student_left_index
+                right_index = student_left_index if is_teacher_view else student_right_index
+
+                row_indices.extend([left_index, right_index])
+            grid.append(row_indices)
+
+        row_count = rows_per_section
+    else:
+        for c in range(cols):
+            col_label = f'{cols - c}열' if is_teacher_view else f'{c + 1}열'
+            column_labels.append((c, 1, col_label))
+
+        for r in range(rows):
+            read_row = rows - 1 - r if is_teacher_view else r
+            grid.append([
+                read_row * cols + (cols - 1 - c if is_teacher_view else c)
+                for c in range(cols)
+            ])
+
+        row_count = rows
+
+    row_labels = [
+        f'{row_count - r}행' if is_teacher_view else f'{r + 1}행'
+        for r in range(row_count)
+    ]
+    return grid, column_labels, row_labels
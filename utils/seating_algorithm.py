@@ -4,11 +4,19 @@
 import random
 from typing import List, Dict, Tuple
 
+# 너무 가까운 자리로 보는 좌표 차이 (상하좌우 + 대각선, 같은 행/열 2칸 이내)
+TOO_CLOSE_OFFSETS = [
+    (dr, dc)
+    for dr in range(-2, 3)
+    for dc in range(-2, 3)
+    if (abs(dr) <= 1 and abs(dc) <= 1) or dr == 0 or dc == 0
+]
+
 def get_seat_coordinates(index: int, layout_type: str, rows: int, cols: int) -> Tuple[int, int]:
     """자리 인덱스를 좌표로 변환"""
     if layout_type == 'pairs':
-        # 짝꿍형 배치의 경우
-        rows_per_section = rows
+        # 짝꿍형 배치의 경우 (rows 는 분단 수, cols 는 분단별 행 수)
+        rows_per_section = cols
         desks_per_section = rows_per_section * 2
         section = index // desks_per_section
         index_in_section = index % desks_per_section
@@ -78,21 +86,23 @@ def generate_seating_arrangement(
         total_seats = rows * cols
     
     # 사용 가능한 자리 계산
+    disabled_set = set(disabled_seats)
     available_seats = []
     for i in range(total_seats):
-        if i not in disabled_seats and i not in pre_assigned_seats:
+        if i not in disabled_set and i not in pre_assigned_seats:
             available_seats.append(i)
     
     # 사전 지정된 학생들 제외
     pre_assigned_students = set(pre_assigned_seats.values())
     regular_students = [s for s in students if s not in pre_assigned_students]
     
-    # 자리 띄우기 대상 학생들 처리
+    # 자리 띄우기 대상 학생들 처리 (일반 학생 그룹에서 제외해 중복 배치 방지)
     distanced_students = [s for s in distanced_students if s not in pre_assigned_students]
+    distanced_set = set(distanced_students)
+    regular_students = [s for s in regular_students if s not in distanced_set]
     
     # 결과 초기화
     result = pre_assigned_seats.copy()
-    placed_distanced_indices = []
     unplaced_distanced = []
     
     # 1. 자리 띄우기 대상 학생들 배치
@@ -100,25 +110,34 @@ def generate_seating_arrangement(
         shuffled_available = available_seats.copy()
         random.shuffle(shuffled_available)
         
+        # 이미 배치된 대상 학생과 너무 가까운 자리 (is_too_close 와 같은 기준)
+        seat_by_coordinates = {
+            get_seat_coordinates(i, layout_type, rows, cols): i for i in range(total_seats)
+        }
+        blocked_seats = set()
+        placed_seats = set()
+        position = 0
+        
         for student in distanced_students:
-            placed = False
-            for i, seat_index in enumerate(shuffled_available):
-                # 다른 자리 띄우기 대상 학생들과 너무 가까운지 확인
-                too_close = any(is_too_close(seat_index, placed_idx, layout_type, rows, cols) 
-                              for placed_idx in placed_distanced_indices)
-                
-                if not too_close:
-                    result[seat_index] = student
-                    placed_distanced_indices.append(seat_index)
-                    shuffled_available.pop(i)
-                    placed = True
-                    break
+            # 막힌 자리는 계속 막혀 있으므로 앞에서 멈춘 위치부터 이어서 탐색
+            while position < len(shuffled_available) and shuffled_available[position] in blocked_seats:
+                position += 1
             
-            if not placed:
+            if position == len(shuffled_available):
                 unplaced_distanced.append(student)
+                continue
+            
+            seat_index = shuffled_available[position]
+            result[seat_index] = student
+            placed_seats.add(seat_index)
+            row, col = get_seat_coordinates(seat_index, layout_type, rows, cols)
+            for dr, dc in TOO_CLOSE_OFFSETS:
+                neighbor = seat_by_coordinates.get((row + dr, col + dc))
+                if neighbor is not None:
+                    blocked_seats.add(neighbor)
         
-        # 사용 가능한 자리 업데이트
-        available_seats = shuffled_available
+        # 사용 가능한 자리 업데이트 (섞인 순서 유지)
+        available_seats = [i for i in shuffled_available if i not in placed_seats]
     
     # 자리 띄우기에 실패한 학생들을 일반 학생 그룹에 추가
     regular_students.extend(unplaced_distanced)